@@ -1,3 +1,10 @@
 """Tab CLI - A CLI tool for tabular data."""
 
+import os
+
 __version__ = "0.1.0"
+
+# Polars sizes its thread pool when it is first imported, so this has to run before any
+# tab_cli module imports polars. An explicit POLARS_MAX_THREADS still takes precedence.
+if "TAB_MAX_THREADS" in os.environ:
+    os.environ.setdefault("POLARS_MAX_THREADS", os.environ["TAB_MAX_THREADS"])
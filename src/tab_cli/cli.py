@@ -1,15 +1,22 @@
 """Main CLI entry point using Typer."""
 
+import errno
+import io
+import os
 import sys
-from typing import Annotated, Optional
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Annotated, BinaryIO, Optional
 
 from loguru import logger
 import polars as pl
 import typer
 from rich.console import Console
 from rich.logging import RichHandler
+from rich.markup import escape
 
 from tab_cli import config
+from tab_cli.formats.base import Frame
 from tab_cli.handlers import TableWriter, infer_reader, infer_writer
 from tab_cli.handlers.cli_table import CliTableFormatter
 
@@ -47,24 +54,56 @@ def main_callback(
     )
 
 
+@contextmanager
+def _stdout() -> Generator[BinaryIO, None, None]:
+    """Binary stdout with a large buffer, so many small chunk writes coalesce into few syscalls."""
+    stream = io.BufferedWriter(sys.stdout.buffer, buffer_size=1 << 20)
+    try:
+        yield stream
+        stream.flush()
+    except (OSError, pl.exceptions.ComputeError) as e:
+        if not _is_broken_pipe(e):
+            raise
+        # The reader went away (e.g. `| head`): exit quietly like Click does for EPIPE.
+        # Point stdout at devnull so the remaining flushes, here and at shutdown, succeed.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+        sys.exit(1)
+    finally:
+        # Flush and release the wrapper without closing the underlying stdout
+        stream.detach()
+
+
+def _is_broken_pipe(e: Exception) -> bool:
+    # Polars sinks raise an OSError without errno set (or a ComputeError, for Parquet)
+    # that only carries the OS message
+    if isinstance(e, OSError) and e.errno == errno.EPIPE:
+        return True
+    return f"(os error {errno.EPIPE})" in str(e)
+
+
 def _apply_limit(
     lf: pl.LazyFrame,
     limit: int | None,
     skip: int,
     default_limit: int | None = None,
-) -> tuple[pl.LazyFrame, bool]:
+) -> tuple[Frame, bool]:
     """Apply skip/limit to a LazyFrame, optionally detecting truncation.
 
     If limit is None and default_limit is set, caps at default_limit rows
-    and returns whether the data was truncated.
+    and returns whether the data was truncated. The probed rows are then
+    returned as a DataFrame, so writers don't collect them again.
     """
     if limit is None and default_limit is not None:
+        # Probe one extra row; the slice is pushed down into the scan, and the
+        # streaming engine stops reading as soon as enough rows are produced
         lf = lf.slice(skip, length=default_limit + 1)
-        df = lf.collect()
+        df = lf.collect(engine="streaming")
         truncated = len(df) > default_limit
         if truncated:
             df = df.head(default_limit)
-        return df.lazy(), truncated
+        return df, truncated
     else:
         if skip > 0 or limit is not None:
             lf = lf.slice(skip, length=limit)
@@ -82,10 +121,10 @@ def view(
     """View tabular data as a formatted table."""
     reader = infer_reader(path, format=input)
     lf = reader.read(path)
-    lf, truncated = _apply_limit(lf, limit=limit, skip=skip, default_limit=20 if limit is None else None)
+    frame, truncated = _apply_limit(lf, limit=limit, skip=skip, default_limit=20 if limit is None else None)
     writer = CliTableFormatter(truncated=truncated, max_cell_len=max_cell_len)
-    for chunk in writer.write(lf):
-        sys.stdout.buffer.write(chunk)
+    with _stdout() as stdout:
+        writer.write_to_stream(frame, stdout)
 
 @app.command()
 def schema(
@@ -113,11 +152,13 @@ def sql(
     lf = reader.read(path)
     ctx = pl.SQLContext(t=lf, eager=False)
     result_lf = ctx.execute(query)
+    # Predicate/projection/slice pushdown are on by default; show the optimized plan so it can be verified
+    logger.opt(lazy=True).debug("Optimized query plan:\n{}", lambda: escape(result_lf.explain(optimized=True)))
     show_truncation = limit is None and output is None
-    result_lf, truncated = _apply_limit(result_lf, limit=limit, skip=skip, default_limit=20 if show_truncation else None)
+    result, truncated = _apply_limit(result_lf, limit=limit, skip=skip, default_limit=20 if show_truncation else None)
     writer = infer_writer(output, truncated=truncated)
-    for chunk in writer.write(result_lf):
-        sys.stdout.buffer.write(chunk)
+    with _stdout() as stdout:
+        writer.write_to_stream(result, stdout)
 
 
 @app.command()
@@ -162,15 +203,14 @@ def cat(
 ) -> None:
     """Concatenate tabular data from multiple files, or just print a single file."""
     reader = infer_reader(paths[0], format=input)
-    files = [reader.read(path) for path in paths]
-    lf = pl.concat(files, how="vertical")
+    lf = reader.read_many(paths)
     if output is not None:
         writer = infer_writer(format=output)
     else:
         writer = infer_writer(format=reader.format.extension())
         assert isinstance(writer, TableWriter)
-    for chunk in writer.write(lf):
-        sys.stdout.buffer.write(chunk)
+    with _stdout() as stdout:
+        writer.write_to_stream(lf, stdout)
 
 
 def main() -> None:
@@ -7,7 +7,7 @@ from typing import BinaryIO
 import polars as pl
 import polars_fastavro
 
-from tab_cli.formats.base import FormatHandler
+from tab_cli.formats.base import FormatHandler, Frame, collect_frame
 
 
 class AvroFormat(FormatHandler):
@@ -16,14 +16,12 @@ class AvroFormat(FormatHandler):
     def extension(self) -> str:
         return "avro"
 
-    def supports_glob(self) -> bool:
-        # polars_fastavro doesn't support glob patterns
-        return False
-
-    def scan(self, url: str, storage_options: dict[str, str] | None = None) -> pl.LazyFrame:
+    def scan(self, url: str | list[str], storage_options: dict[str, str] | None = None, n_rows: int | None = None) -> pl.LazyFrame:
         # polars_fastavro doesn't support storage_options, so cloud URIs
         # need to be accessed through fsspec first
-        return polars_fastavro.scan_avro(url)
+        lf = polars_fastavro.scan_avro(url)
+        # polars_fastavro has no n_rows option; head() is pushed into the scan instead
+        return lf.head(n_rows) if n_rows is not None else lf
 
     def read_stream(self, stream: BinaryIO) -> pl.DataFrame:
         return polars_fastavro.read_avro(stream)
@@ -32,13 +30,9 @@ class AvroFormat(FormatHandler):
         # polars_fastavro doesn't support storage_options
         return list(polars_fastavro.scan_avro(url).collect_schema().items())
 
-    def count_rows(self, url: str, storage_options: dict[str, str] | None = None) -> int:
-        # polars_fastavro doesn't support storage_options
-        return polars_fastavro.scan_avro(url).select(pl.len()).collect().item()
-
-    def write(self, lf: pl.LazyFrame) -> Iterable[bytes]:
+    def write(self, lf: Frame) -> Iterable[bytes]:
         output = BytesIO()
-        df = lf.collect()
+        df = collect_frame(lf)
         polars_fastavro.write_avro(df, output)
         yield output.getvalue()
 
@@ -1,11 +1,28 @@
 """Base format handler interface."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import BinaryIO
 
 import polars as pl
 
+# Output frames are lazy, or already collected when a limit probe materialized them
+Frame = pl.LazyFrame | pl.DataFrame
+
+
+def iter_batches(frame: Frame) -> Iterator[pl.DataFrame]:
+    """Iterate over a frame in DataFrame batches without re-collecting eager frames."""
+    if isinstance(frame, pl.DataFrame):
+        return frame.iter_slices()
+    return iter(frame.collect_batches())
+
+
+def collect_frame(frame: Frame) -> pl.DataFrame:
+    """Collect a frame into a DataFrame, returning eager frames as-is."""
+    if isinstance(frame, pl.DataFrame):
+        return frame
+    return frame.collect()
+
 
 class FormatHandler(ABC):
     """Handles reading and writing a specific tabular format."""
@@ -15,24 +32,25 @@ class FormatHandler(ABC):
         """Return the file extension (e.g., '.parquet')."""
         pass
 
-    def supports_glob(self) -> bool:
-        """Whether this format supports glob patterns in scan().
-
-        Formats with native Polars support (Parquet, CSV, JSONL) can scan
-        directories directly. Others (Avro) need manual file iteration.
-        """
-        return False
-
     @abstractmethod
-    def scan(self, url: str, storage_options: dict[str, str] | None = None) -> pl.LazyFrame:
+    def scan(self, url: str | list[str], storage_options: dict[str, str] | None = None, n_rows: int | None = None) -> pl.LazyFrame:
         """Scan from a URL (local path or cloud URL).
 
         Args:
-            url: The URL to scan from.
+            url: The URL to scan from, or a list of URLs to scan as one table.
             storage_options: Optional storage options for cloud access.
+            n_rows: Stop reading after this many rows, if given.
         """
         pass
 
+    def partition_columns(self, root: str, urls: list[str]) -> list[tuple[str, pl.DataType]]:
+        """Columns that the directory layout below root adds to the files' own columns."""
+        return []
+
+    def scan_directory(self, root: str, urls: list[str], storage_options: dict[str, str] | None = None) -> pl.LazyFrame:
+        """Scan the data files listed from the directory root as one table."""
+        return self.scan(urls, storage_options=storage_options)
+
     @abstractmethod
     def read_stream(self, stream: BinaryIO) -> pl.DataFrame:
         """Read from a byte stream. Returns eager DataFrame."""
@@ -43,20 +61,34 @@ class FormatHandler(ABC):
         """Get schema as list of (name, dtype) tuples."""
         pass
 
-    @abstractmethod
-    def count_rows(self, url: str, storage_options: dict[str, str] | None = None) -> int:
-        """Count rows in the file."""
-        pass
+    def summarize(self, url: str, storage_options: dict[str, str] | None = None) -> tuple[int, list[tuple[str, pl.DataType]]]:
+        """Count rows and get the schema from a single scan.
+
+        Returns:
+            Tuple of (row count, list of (name, dtype) tuples).
+        """
+        lf = self.scan(url, storage_options=storage_options)
+        columns = list(lf.collect_schema().items())
+        num_rows = lf.select(pl.len()).collect(engine="streaming").item()
+        return num_rows, columns
 
     def extra_summary(self, url: str) -> dict[str, str | int | float] | None:
         """Return format-specific summary metadata, if any."""
         return None
 
     @abstractmethod
-    def write(self, lf: pl.LazyFrame) -> Iterable[bytes]:
+    def write(self, lf: Frame) -> Iterable[bytes]:
         """Write LazyFrame to bytes (for streaming output)."""
         pass
 
+    def write_to_stream(self, lf: Frame, stream: BinaryIO) -> None:
+        """Write LazyFrame to a binary stream (e.g., stdout).
+
+        Defaults to writing the chunks produced by write(). Formats whose
+        Polars sink can target a stream directly should override this.
+        """
+        stream.writelines(self.write(lf))
+
     @abstractmethod
     def write_to_single_file(self, lf: pl.LazyFrame, path: str) -> None:
         """Write LazyFrame to a single file."""
@@ -6,7 +6,7 @@ from typing import BinaryIO
 
 import polars as pl
 
-from tab_cli.formats.base import FormatHandler
+from tab_cli.formats.base import FormatHandler, Frame, iter_batches
 
 
 class CsvFormat(FormatHandler):
@@ -18,11 +18,8 @@ class CsvFormat(FormatHandler):
     def extension(self) -> str:
         return "csv" if self.separator == "," else "tsv"
 
-    def supports_glob(self) -> bool:
-        return True
-
-    def scan(self, url: str, storage_options: dict[str, str] | None = None) -> pl.LazyFrame:
-        return pl.scan_csv(url, separator=self.separator, storage_options=storage_options)
+    def scan(self, url: str | list[str], storage_options: dict[str, str] | None = None, n_rows: int | None = None) -> pl.LazyFrame:
+        return pl.scan_csv(url, separator=self.separator, storage_options=storage_options, n_rows=n_rows)
 
     def read_stream(self, stream: BinaryIO) -> pl.DataFrame:
         return pl.read_csv(stream, separator=self.separator)
@@ -30,16 +27,21 @@ class CsvFormat(FormatHandler):
     def collect_schema(self, url: str, storage_options: dict[str, str] | None = None) -> list[tuple[str, pl.DataType]]:
         return list(pl.scan_csv(url, separator=self.separator, storage_options=storage_options).collect_schema().items())
 
-    def count_rows(self, url: str, storage_options: dict[str, str] | None = None) -> int:
-        return pl.scan_csv(url, separator=self.separator, storage_options=storage_options).select(pl.len()).collect().item()
-
-    def write(self, lf: pl.LazyFrame) -> Iterable[bytes]:
+    def write(self, lf: Frame) -> Iterable[bytes]:
         first = True
-        for batch in lf.collect_batches():
-            output = BytesIO()
+        output = BytesIO()
+        for batch in iter_batches(lf):
+            output.seek(0)
+            output.truncate()
             batch.write_csv(output, separator=self.separator, include_header=first)
             first = False
             yield output.getvalue()
 
+    def write_to_stream(self, lf: Frame, stream: BinaryIO) -> None:
+        if isinstance(lf, pl.DataFrame):
+            lf.write_csv(stream, separator=self.separator)
+        else:
+            lf.sink_csv(stream, separator=self.separator)
+
     def write_to_single_file(self, lf: pl.LazyFrame, path: str) -> None:
         lf.sink_csv(path, separator=self.separator)
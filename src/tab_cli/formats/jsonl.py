@@ -1,12 +1,36 @@
 """JSONL (newline-delimited JSON) format handler."""
 
-import json
 from collections.abc import Iterable
-from typing import BinaryIO
+from io import BytesIO
+from typing import BinaryIO, overload
 
 import polars as pl
+from polars._typing import PolarsDataType
 
-from tab_cli.formats.base import FormatHandler
+from tab_cli.formats.base import FormatHandler, Frame, iter_batches
+
+
+def _encode_binary(expr: pl.Expr, dtype: PolarsDataType) -> pl.Expr | None:
+    """Base64-encode the binary values of expr, however deeply nested, or None if it holds none."""
+    if isinstance(dtype, pl.Binary):
+        return expr.bin.encode("base64")
+    if isinstance(dtype, pl.Struct):
+        fields = [(field.name, _encode_binary(expr.struct.field(field.name), field.dtype)) for field in dtype.fields]
+        if all(encoded is None for _, encoded in fields):
+            return None
+        encoded_struct = pl.struct(
+            encoded.alias(name) if encoded is not None else expr.struct.field(name) for name, encoded in fields
+        )
+        # Rebuilding the struct would turn null structs into structs of nulls
+        return pl.when(expr.is_not_null()).then(encoded_struct)
+    if isinstance(dtype, (pl.List, pl.Array)):
+        encoded = _encode_binary(pl.element(), dtype.inner)
+        if encoded is None:
+            return None
+        if isinstance(dtype, pl.Array):
+            expr = expr.cast(pl.List(dtype.inner))
+        return expr.list.eval(encoded)
+    return None
 
 
 class JsonlFormat(FormatHandler):
@@ -15,11 +39,8 @@ class JsonlFormat(FormatHandler):
     def extension(self) -> str:
         return "jsonl"
 
-    def supports_glob(self) -> bool:
-        return True
-
-    def scan(self, url: str, storage_options: dict[str, str] | None = None) -> pl.LazyFrame:
-        return pl.scan_ndjson(url, storage_options=storage_options)
+    def scan(self, url: str | list[str], storage_options: dict[str, str] | None = None, n_rows: int | None = None) -> pl.LazyFrame:
+        return pl.scan_ndjson(url, storage_options=storage_options, n_rows=n_rows)
 
     def read_stream(self, stream: BinaryIO) -> pl.DataFrame:
         return pl.read_ndjson(stream)
@@ -27,15 +48,35 @@ class JsonlFormat(FormatHandler):
     def collect_schema(self, url: str, storage_options: dict[str, str] | None = None) -> list[tuple[str, pl.DataType]]:
         return list(pl.scan_ndjson(url, storage_options=storage_options).collect_schema().items())
 
-    def count_rows(self, url: str, storage_options: dict[str, str] | None = None) -> int:
-        return pl.scan_ndjson(url, storage_options=storage_options).select(pl.len()).collect().item()
+    @overload
+    def _encodable(self, lf: pl.LazyFrame) -> pl.LazyFrame: ...
+
+    @overload
+    def _encodable(self, lf: pl.DataFrame) -> pl.DataFrame: ...
+
+    def _encodable(self, lf: Frame) -> Frame:
+        # The native JSON encoder has no representation for raw bytes, also inside structs and lists
+        encoded = [
+            expr.alias(name)
+            for name, dtype in lf.collect_schema().items()
+            if (expr := _encode_binary(pl.col(name), dtype)) is not None
+        ]
+        return lf.with_columns(encoded) if encoded else lf
+
+    def write(self, lf: Frame) -> Iterable[bytes]:
+        output = BytesIO()
+        for batch in iter_batches(self._encodable(lf)):
+            output.seek(0)
+            output.truncate()
+            batch.write_ndjson(output)
+            yield output.getvalue()
 
-    def write(self, lf: pl.LazyFrame) -> Iterable[bytes]:
-        for batch in lf.collect_batches():
-            for row in batch.iter_rows(named=True):
-                yield (json.dumps(row, default=str, ensure_ascii=False) + "\n").encode("utf-8")
+    def write_to_stream(self, lf: Frame, stream: BinaryIO) -> None:
+        lf = self._encodable(lf)
+        if isinstance(lf, pl.DataFrame):
+            lf.write_ndjson(stream)
+        else:
+            lf.sink_ndjson(stream)
 
     def write_to_single_file(self, lf: pl.LazyFrame, path: str) -> None:
-        with open(path, "wb") as f:
-            for chunk in self.write(lf):
-                f.write(chunk)
+        self._encodable(lf).sink_ndjson(path)
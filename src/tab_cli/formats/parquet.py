@@ -1,12 +1,92 @@
 """Parquet format handler."""
 
+import io
+import itertools
+import os
 from collections.abc import Iterable
-from io import BytesIO
+from functools import lru_cache
 from typing import BinaryIO
+from urllib.parse import unquote
 
 import polars as pl
+import pyarrow.parquet as pq
 
-from tab_cli.formats.base import FormatHandler
+from tab_cli.formats.base import FormatHandler, Frame, iter_batches
+
+
+@lru_cache(maxsize=128)
+def _read_footer(path: str, mtime_ns: int, size: int) -> pq.FileMetaData:
+    # Keyed on mtime and size as well, so a rewritten file is never served stale metadata
+    return pq.read_metadata(path)
+
+
+def _columns(metadata: pq.FileMetaData) -> list[tuple[str, pl.DataType]]:
+    arrow_schema = metadata.schema.to_arrow_schema()
+    return list(pl.DataFrame(arrow_schema.empty_table()).schema.items())
+
+
+# Spark and Hive write this for a null partition value
+_HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _hive_values(root: str, url: str) -> dict[str, str | None]:
+    """Parse key=value directory segments of a file URL, counting only those below root."""
+    relative = url.removeprefix(root)
+    values: dict[str, str | None] = {}
+    for segment in relative.replace(os.sep, "/").strip("/").split("/")[:-1]:
+        key, sep, value = segment.partition("=")
+        if sep and key:
+            value = unquote(value)
+            values[key] = None if value == _HIVE_NULL else value
+    return values
+
+
+def _hive_dtype(values: Iterable[str | None]) -> pl.DataType:
+    present = [v for v in values if v is not None]
+    for dtype, parse in ((pl.Int64(), int), (pl.Float64(), float)):
+        try:
+            for value in present:
+                parse(value)
+        except ValueError:
+            continue
+        return dtype
+    return pl.String()
+
+
+def _hive_partitions(root: str, urls: list[str]) -> tuple[dict[str, pl.DataType], list[dict[str, str | None]]]:
+    """Infer the partition columns under root, along with each file's partition values."""
+    per_file = [_hive_values(root.rstrip("/"), url) for url in urls]
+    keys = dict.fromkeys(key for values in per_file for key in values)
+    dtypes = {key: _hive_dtype(values.get(key) for values in per_file) for key in keys}
+    return dtypes, per_file
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only sink that hands back what was written since the last drain.
+
+    Tracks its own position, since the Parquet footer records absolute offsets.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        self._position += len(b)
+        return len(b)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
 
 
 class ParquetFormat(FormatHandler):
@@ -15,29 +95,95 @@ class ParquetFormat(FormatHandler):
     def extension(self) -> str:
         return "parquet"
 
-    def supports_glob(self) -> bool:
-        return True
+    def scan(self, url: str | list[str], storage_options: dict[str, str] | None = None, n_rows: int | None = None) -> pl.LazyFrame:
+        # Explicit files carry no partition directories, so skip hive auto-detection on their paths
+        return pl.scan_parquet(url, storage_options=storage_options, n_rows=n_rows, hive_partitioning=False)
+
+    def partition_columns(self, root: str, urls: list[str]) -> list[tuple[str, pl.DataType]]:
+        dtypes, _ = _hive_partitions(root, urls)
+        return list(dtypes.items())
 
-    def scan(self, url: str, storage_options: dict[str, str] | None = None) -> pl.LazyFrame:
-        return pl.scan_parquet(url, storage_options=storage_options)
+    def scan_directory(self, root: str, urls: list[str], storage_options: dict[str, str] | None = None) -> pl.LazyFrame:
+        # Polars' own hive_partitioning parses every key=value segment of the full path, lets
+        # partition values overwrite file columns, and fails when files sit at different depths.
+        # So partitions are parsed only below root and attached to each run of files here.
+        dtypes, per_file = _hive_partitions(root, urls)
+        if dtypes:
+            # A column stored in the files always wins over a partition key of the same name
+            file_columns = self.scan(urls[0], storage_options=storage_options).collect_schema()
+            dtypes = {key: dtype for key, dtype in dtypes.items() if key not in file_columns}
+        if not dtypes:
+            return self.scan(urls, storage_options=storage_options)
+
+        frames = []
+        # Consecutive files in the same partition share one scan; listing order is kept
+        runs = itertools.groupby(zip(urls, per_file), key=lambda item: tuple(item[1].get(key) for key in dtypes))
+        for values, run in runs:
+            lf = self.scan([url for url, _ in run], storage_options=storage_options)
+            # Files above a partition level (mixed depths) get nulls for the keys they lack
+            frames.append(lf.with_columns(
+                pl.lit(value).cast(dtype).alias(key) for (key, dtype), value in zip(dtypes.items(), values)
+            ))
+        return pl.concat(frames, how="vertical", rechunk=False)
 
     def read_stream(self, stream: BinaryIO) -> pl.DataFrame:
         return pl.read_parquet(stream)
 
+    def _read_metadata(self, url: str) -> pq.FileMetaData | None:
+        """Read the footer of a local Parquet file, or None for cloud URLs."""
+        # storage_options are in Polars/object_store form and don't map onto pyarrow
+        # filesystems, so remote files go through the Polars scan instead
+        if "://" in url:
+            return None
+        # summarize() and extra_summary() both need the footer; it is read only once
+        stat = os.stat(url)
+        return _read_footer(url, stat.st_mtime_ns, stat.st_size)
+
     def collect_schema(self, url: str, storage_options: dict[str, str] | None = None) -> list[tuple[str, pl.DataType]]:
-        return list(pl.scan_parquet(url, storage_options=storage_options).collect_schema().items())
+        metadata = self._read_metadata(url)
+        if metadata is not None:
+            return _columns(metadata)
+        return list(self.scan(url, storage_options=storage_options).collect_schema().items())
 
-    def count_rows(self, url: str, storage_options: dict[str, str] | None = None) -> int:
-        return pl.scan_parquet(url, storage_options=storage_options).select(pl.len()).collect().item()
+    def summarize(self, url: str, storage_options: dict[str, str] | None = None) -> tuple[int, list[tuple[str, pl.DataType]]]:
+        metadata = self._read_metadata(url)
+        if metadata is not None:
+            return metadata.num_rows, _columns(metadata)
+        return super().summarize(url, storage_options=storage_options)
 
     def extra_summary(self, url: str) -> dict[str, str | int | float] | None:
-        # TODO: Parquet metadata
-        pass
+        metadata = self._read_metadata(url)
+        if metadata is None:
+            return None
+        row_groups = [metadata.row_group(i) for i in range(metadata.num_row_groups)]
+        codecs = {rg.column(j).compression for rg in row_groups for j in range(rg.num_columns)}
+        return {
+            "Row groups": metadata.num_row_groups,
+            "Compression": ", ".join(sorted(codecs)),
+        }
+
+    def write(self, lf: Frame) -> Iterable[bytes]:
+        # One row group per batch, yielded as soon as it is encoded rather than after the whole file
+        sink = _ChunkSink()
+        writer: pq.ParquetWriter | None = None
+        for batch in iter_batches(lf):
+            table = batch.to_arrow()
+            if writer is None:
+                writer = pq.ParquetWriter(sink, table.schema, compression="zstd")
+            writer.write_table(table)
+            yield sink.drain()
+        if writer is None:
+            schema = lf.collect_schema() if isinstance(lf, pl.LazyFrame) else lf.schema
+            writer = pq.ParquetWriter(sink, pl.DataFrame(schema=schema).to_arrow().schema, compression="zstd")
+        writer.close()
+        yield sink.drain()
 
-    def write(self, lf: pl.LazyFrame) -> Iterable[bytes]:
-        output = BytesIO()
-        lf.sink_parquet(output)
-        yield output.getvalue()
+    def write_to_stream(self, lf: Frame, stream: BinaryIO) -> None:
+        if isinstance(lf, pl.DataFrame):
+            lf.write_parquet(stream)
+        else:
+            # Sink row groups straight into the stream instead of buffering the whole file
+            lf.sink_parquet(stream)
 
     def write_to_single_file(self, lf: pl.LazyFrame, path: str) -> None:
         lf.sink_parquet(path)
@@ -1,6 +1,7 @@
 """Handler registration and inference."""
 
-import os
+import re
+from urllib.parse import urlparse
 
 from tab_cli.formats import AvroFormat, CsvFormat, JsonlFormat, ParquetFormat
 from tab_cli.formats.base import FormatHandler
@@ -18,21 +19,27 @@ _FORMAT_MAP: dict[str, FormatHandler] = {
 }
 
 
+# Extension of the last path segment
+_EXTENSION_RE = re.compile(r"\.([^./]+)$")
+
+
 def _get_extension(path: str) -> str:
     """Extract file extension from a path or URL."""
-    # Handle URIs by getting the path component
+    # Only URLs carry a query string or fragment; "?" and "#" are legal in local file names
     if "://" in path:
-        path = path.split("://", 1)[1]
-    # Get extension from basename
-    basename = os.path.basename(path.rstrip("/"))
-    return os.path.splitext(basename)[1][1:].lower()
+        path = urlparse(path).path
+    match = _EXTENSION_RE.search(path.rstrip("/"))
+    return match.group(1).lower() if match else ""
 
 
-def _is_data_file(path: str) -> bool:
-    """Check if a file is a data file (not metadata/marker file)."""
-    basename = os.path.basename(path.rstrip("/"))
-    # Skip hidden files (e.g., .crc files) or Spark/Hadoop marker and metadata files
-    return not (basename.startswith(".") or basename.startswith("_"))
+def _get_format(format: str) -> FormatHandler:
+    """Look up a format handler by name, case-insensitively."""
+    fmt = _FORMAT_MAP.get(format)
+    if fmt is None:
+        fmt = _FORMAT_MAP.get(format.lower())
+    if fmt is None:
+        raise ValueError(f"Unknown format: {format}. Supported: {', '.join(_FORMAT_MAP)}")
+    return fmt
 
 
 def infer_reader(path: str, format: str | None = None) -> TableReader:
@@ -48,17 +55,12 @@ def infer_reader(path: str, format: str | None = None) -> TableReader:
     backend = get_backend(path)
 
     if format is not None:
-        fmt = _FORMAT_MAP.get(format.lower())
-        if fmt is None:
-            raise ValueError(f"Unknown format: {format}. Supported: {', '.join(_FORMAT_MAP)}")
-        return TableReader(backend, fmt)
+        return TableReader(backend, _get_format(format))
 
     # Infer format from path
     if backend.is_directory(path):
-        # Get extension from first data file in directory (skip metadata files)
+        # Get extension from first data file in directory (metadata files are never listed)
         for file_info in backend.list_files(path, ""):
-            if not _is_data_file(file_info.url):
-                continue
             extension = _get_extension(file_info.url)
             if extension:
                 break
@@ -90,8 +92,4 @@ def infer_writer(format: str | None = None, truncated: bool = False, max_cell_le
     if format == "table-svg":
         return CliTableFormatter(truncated=truncated, svg_capture=True, max_cell_len=max_cell_len)
 
-    fmt = _FORMAT_MAP.get(format.lower())
-    if fmt is None:
-        raise ValueError(f"Unknown format: {format}. Supported: {', '.join(_FORMAT_MAP)}")
-
-    return FormatWriter(fmt)
+    return FormatWriter(_get_format(format))
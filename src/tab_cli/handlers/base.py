@@ -2,26 +2,38 @@
 
 import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
+from typing import BinaryIO
 
 import polars as pl
 from rich import box
 from rich.progress import Progress, track
 from rich.table import Table
 
-from tab_cli.formats.base import FormatHandler
-from tab_cli.storage.base import StorageBackend
+from tab_cli.formats.base import FormatHandler, Frame
+from tab_cli.storage.base import MAX_IO_WORKERS, FileInfo, StorageBackend
 from tab_cli.style import _ALT_ROW_STYLE_0, _ALT_ROW_STYLE_1, _KEY_STYLE, _VAL_STYLE
 
+_SIZE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB")
 
-@dataclass
+
+@dataclass(frozen=True)
 class TableSchema:
     """Schema information for a table."""
 
     columns: list[tuple[str, pl.DataType]]
 
     def __rich__(self) -> Table:
+        return self._table
+
+    @cached_property
+    def _table(self) -> Table:
+        # The schema is immutable, so the table is built once however often it's rendered
+        rows = [(name, str(dtype)) for name, dtype in self.columns]
         table = Table(
             show_header=False,
             box=box.SIMPLE_HEAD,
@@ -29,8 +41,8 @@ class TableSchema:
         )
         table.add_column(style=_KEY_STYLE)
         table.add_column(style=_VAL_STYLE)
-        for name, dtype in self.columns:
-            table.add_row(name, str(dtype))
+        for row in rows:
+            table.add_row(*row)
         return table
 
 
@@ -45,12 +57,11 @@ class TableSummary:
 
     def __rich__(self) -> Table:
         def format_size(size: int) -> str:
-            s: float = size
-            for unit in ["B", "KiB", "MiB", "GiB", "TiB"]:
-                if s < 1024:
-                    return f"{s:.1f} {unit}" if unit != "B" else f"{int(s)} {unit}"
-                s /= 1024
-            return f"{s:.1f} PiB"
+            # Each unit spans 10 bits, so the bit length picks the unit directly
+            shift = min(max(0, (size.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+            if shift == 0:
+                return f"{size} B"
+            return f"{size / (1 << (shift * 10)):.1f} {_SIZE_UNITS[shift]}"
 
         table = Table(
             show_header=False,
@@ -77,6 +88,17 @@ class TableReader:
     def __init__(self, backend: StorageBackend, format: FormatHandler):
         self.backend = backend
         self.format = format
+        self._files_cache: dict[str, list[FileInfo]] = {}
+
+    def _list_data_files(self, url: str) -> list[FileInfo]:
+        """List the data files of this format in a directory, once per reader."""
+        files = self._files_cache.get(url)
+        if files is None:
+            files = list(self.backend.list_files(url, "." + self.format.extension()))
+            if not files:
+                raise ValueError(f"No {self.format.extension()} files found in {url}")
+            self._files_cache[url] = files
+        return files
 
     def read(self, url: str, limit: int | None = None, offset: int = 0) -> pl.LazyFrame:
         if self.backend.is_directory(url):
@@ -84,7 +106,9 @@ class TableReader:
         else:
             polars_uri = self.backend.normalize_for_polars(url)
             storage_options = self.backend.storage_options(url)
-            lf = self.format.scan(polars_uri, storage_options=storage_options)
+            # Let the reader stop decoding once the requested window has been read
+            n_rows = offset + limit if limit is not None else None
+            lf = self.format.scan(polars_uri, storage_options=storage_options, n_rows=n_rows)
 
         if offset > 0:
             lf = lf.slice(offset, length=limit)
@@ -92,37 +116,44 @@ class TableReader:
             lf = lf.head(limit)
         return lf
 
+    def read_many(self, urls: list[str]) -> pl.LazyFrame:
+        """Read several files or directories as one vertically concatenated table."""
+        # Metadata probes are latency-bound round trips on cloud storage, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=min(len(urls), MAX_IO_WORKERS)) as executor:
+            if not any(executor.map(self.backend.is_directory, urls)):
+                # Plain files can be handed to the native multi-path scan in one go
+                polars_uris = [self.backend.normalize_for_polars(url) for url in urls]
+                storage_options = self.backend.storage_options(urls[0])
+                return self.format.scan(polars_uris, storage_options=storage_options)
+            frames = list(executor.map(self.read, urls))
+        return pl.concat(frames, how="vertical", rechunk=False, parallel=False)
+
     def _read_directory(self, url: str) -> pl.LazyFrame:
         """Read all files in a directory."""
-        extension = self.format.extension()
+        # Scan the same filtered listing that schema() and summary() use, rather than a
+        # "**/*ext" glob, so marker and hidden files are skipped consistently everywhere
+        files = self._list_data_files(url)
+        polars_uris = [self.backend.normalize_for_polars(f.url) for f in files]
         storage_options = self.backend.storage_options(url)
+        root = self.backend.normalize_for_polars(url)
+        return self.format.scan_directory(root, polars_uris, storage_options=storage_options)
 
-        if self.format.supports_glob():
-            # Use native glob support
-            polars_uri = self.backend.normalize_for_polars(url)
-            glob_pattern = os.path.join(polars_uri, "**", f"*{extension}")
-            return self.format.scan(glob_pattern, storage_options=storage_options)
-        else:
-            # Manual concatenation for formats without glob support
-            files = list(self.backend.list_files(url, extension))
-            if not files:
-                raise ValueError(f"No {extension} files found in {url}")
-            frames = [
-                self.format.scan(
-                    self.backend.normalize_for_polars(f.url),
-                    storage_options=self.backend.storage_options(f.url),
-                )
-                for f in files
-            ]
-            return pl.concat(frames, how="vertical")
+    def _partition_columns(self, url: str, file_columns: list[tuple[str, pl.DataType]]) -> list[tuple[str, pl.DataType]]:
+        """Partition columns a directory read adds on top of the files' own columns."""
+        files = self._list_data_files(url)
+        polars_uris = [self.backend.normalize_for_polars(f.url) for f in files]
+        root = self.backend.normalize_for_polars(url)
+        names = {name for name, _ in file_columns}
+        return [(name, dtype) for name, dtype in self.format.partition_columns(root, polars_uris) if name not in names]
 
     def schema(self, url: str) -> TableSchema:
         if self.backend.is_directory(url):
-            # Get schema from first file
-            files = list(self.backend.list_files(url, "." + self.format.extension()))
-            if not files:
-                raise ValueError(f"No {self.format.extension()} files found in {url}")
-            url = files[0].url
+            # Describe the table a directory read produces: the files' columns plus any partition columns
+            first = self._list_data_files(url)[0].url
+            polars_uri = self.backend.normalize_for_polars(first)
+            storage_options = self.backend.storage_options(first)
+            columns = self.format.collect_schema(polars_uri, storage_options=storage_options)
+            return TableSchema(columns=columns + self._partition_columns(url, columns))
         polars_uri = self.backend.normalize_for_polars(url)
         storage_options = self.backend.storage_options(url)
         columns = self.format.collect_schema(polars_uri, storage_options=storage_options)
@@ -134,53 +165,60 @@ class TableReader:
         else:
             return self._summary_single(url)
 
-    def _summary_single(self, url: str) -> TableSummary:
-        file_size = self.backend.size(url)
+    def _summary_single(self, url: str, file_size: int | None = None) -> TableSummary:
+        summary, _ = self._summarize_file(url, file_size)
+        return summary
+
+    def _summarize_file(
+        self, url: str, file_size: int | None = None
+    ) -> tuple[TableSummary, list[tuple[str, pl.DataType]]]:
+        """Summarize a single file, also returning its columns."""
+        if file_size is None:
+            file_size = self.backend.size(url)
         polars_uri = self.backend.normalize_for_polars(url)
         storage_options = self.backend.storage_options(url)
-        num_rows = self.format.count_rows(polars_uri, storage_options=storage_options)
-        schema = self.format.collect_schema(polars_uri, storage_options=storage_options)
+        num_rows, schema = self.format.summarize(polars_uri, storage_options=storage_options)
         num_columns = len(schema)
         extra = self.format.extra_summary(url)
-        return TableSummary(
+        summary = TableSummary(
             file_size=file_size,
             num_rows=num_rows,
             num_columns=num_columns,
             extra=extra,
         )
+        return summary, schema
 
     def _summary_directory(self, url: str) -> TableSummary:
         """Aggregate summary from all files in directory."""
-        files = list(self.backend.list_files(url, "." + self.format.extension()))
-        if not files:
-            raise ValueError(f"No {self.format.extension()} files found in {url}")
+        files = self._list_data_files(url)
 
         file_size = 0
         num_rows = 0
         num_columns: int | None = None
-
-        extra_numeric: dict[str, float] = {}
-        extra_strings: dict[str, set[str]] = {}
-
-        for file_info in track(files):
-            file_size += file_info.size
-            polars_uri = self.backend.normalize_for_polars(file_info.url)
-            storage_options = self.backend.storage_options(file_info.url)
-            num_rows += self.format.count_rows(polars_uri, storage_options=storage_options)
-
-            schema = self.format.collect_schema(polars_uri, storage_options=storage_options)
-            if num_columns is None:
-                num_columns = len(schema)
-            elif len(schema) != num_columns:
-                raise ValueError(f"Inconsistent column counts in {url}")
-
-            extra = self.format.extra_summary(file_info.url)
-            if extra:
-                for key, value in extra.items():
-                    if isinstance(value, (int, float)):
-                        extra_numeric[key] = extra_numeric.get(key, 0) + value
-                    else:
-                        extra_strings.setdefault(key, set()).add(str(value))
+        columns: list[tuple[str, pl.DataType]] = []
+
+        extra_numeric: defaultdict[str, float] = defaultdict(float)
+        extra_strings: defaultdict[str, set[str]] = defaultdict(set)
+
+        # Per-file summaries are latency-bound footer/metadata reads, so keep many in flight
+        with ThreadPoolExecutor(max_workers=min(len(files), MAX_IO_WORKERS)) as executor:
+            summaries = executor.map(lambda f: self._summarize_file(f.url, file_size=f.size), files)
+            for summary, file_columns in track(summaries, total=len(files)):
+                file_size += summary.file_size
+                num_rows += summary.num_rows
+                if num_columns is None:
+                    num_columns = summary.num_columns
+                    columns = file_columns
+                elif summary.num_columns != num_columns:
+                    raise ValueError(f"Inconsistent column counts in {url}")
+
+                if summary.extra:
+                    for key, value in summary.extra.items():
+                        if isinstance(value, (int, float)):
+                            extra_numeric[key] += value
+                        else:
+                            # Values may already list several items, e.g. each file's codecs
+                            extra_strings[key].update(str(value).split(", "))
 
         result_extra: dict[str, str | int | float] = {"Partitions": len(files)}
         for key, value in extra_numeric.items():
@@ -190,15 +228,15 @@ class TableReader:
                 result_extra[key] = value
 
         for key, values in extra_strings.items():
-            if len(values) == 1:
-                result_extra[key] = next(iter(values))
-            else:
-                result_extra[key] = ", ".join(sorted(values))
+            result_extra[key] = ", ".join(sorted(values))
+
+        # Files agree on their own columns; the directory layout may add partition columns on top
+        num_columns = (num_columns or 0) + len(self._partition_columns(url, columns))
 
         return TableSummary(
             file_size=file_size,
             num_rows=num_rows,
-            num_columns=num_columns or 0,
+            num_columns=num_columns,
             extra=result_extra,
         )
 
@@ -212,10 +250,14 @@ class TableWriter(ABC):
         pass
 
     @abstractmethod
-    def write(self, lf: pl.LazyFrame) -> Iterable[bytes]:
+    def write(self, lf: Frame) -> Iterable[bytes]:
         """Write LazyFrame to bytes (for streaming output)."""
         pass
 
+    def write_to_stream(self, lf: Frame, stream: BinaryIO) -> None:
+        """Write LazyFrame to a binary stream (e.g., stdout)."""
+        stream.writelines(self.write(lf))
+
     @abstractmethod
     def write_to_single_file(self, lf: pl.LazyFrame, path: str) -> None:
         """Write LazyFrame to a single file."""
@@ -234,13 +276,22 @@ class TableWriter(ABC):
             rows_per_part = (row_count + partitions - 1) // partitions
             with Progress() as progress:
                 task = progress.add_task("Writing partitions...", total=partitions)
-                for i in range(partitions):
-                    offset = i * rows_per_part
-                    if offset < row_count:
-                        part_lf = lf.slice(offset, rows_per_part)
-                        part_path = os.path.join(path, f"part-{i:05d}{self.extension()}")
-                        self.write_to_single_file(part_lf, part_path)
-                    progress.update(task, advance=1)
+                # Polars releases the GIL while collecting/sinking, so partitions encode in parallel
+                with ThreadPoolExecutor(max_workers=min(partitions, os.cpu_count() or 1)) as executor:
+                    futures = []
+                    for i in range(partitions):
+                        offset = i * rows_per_part
+                        if offset < row_count:
+                            part_lf = lf.slice(offset, rows_per_part)
+                            part_path = os.path.join(path, f"part-{i:05d}{self.extension()}")
+                            future = executor.submit(self.write_to_single_file, part_lf, part_path)
+                            future.add_done_callback(lambda _: progress.update(task, advance=1))
+                            futures.append(future)
+                        else:
+                            progress.update(task, advance=1)
+                    for future in futures:
+                        # Surface any write error
+                        future.result()
 
 
 class FormatWriter(TableWriter):
@@ -252,8 +303,11 @@ class FormatWriter(TableWriter):
     def extension(self) -> str:
         return self._format.extension()
 
-    def write(self, lf: pl.LazyFrame) -> Iterable[bytes]:
+    def write(self, lf: Frame) -> Iterable[bytes]:
         return self._format.write(lf)
 
+    def write_to_stream(self, lf: Frame, stream: BinaryIO) -> None:
+        self._format.write_to_stream(lf, stream)
+
     def write_to_single_file(self, lf: pl.LazyFrame, path: str) -> None:
         self._format.write_to_single_file(lf, path)
@@ -6,6 +6,7 @@ from rich import box
 from rich.console import Console
 import polars as pl
 
+from tab_cli.formats.base import Frame, collect_frame
 from tab_cli.handlers.base import TableWriter
 from tab_cli.style import _ALT_ROW_STYLE_0, _ALT_ROW_STYLE_1, _KEY_STYLE
 
@@ -21,10 +22,17 @@ class CliTableFormatter(TableWriter):
             return value[:self.max_cell_len] + "..."
         return value
 
+    def _truncate_strings(self, df: pl.DataFrame) -> pl.DataFrame:
+        """Truncate all string columns inside Polars instead of cell by cell in Python."""
+        s = pl.col(pl.String)
+        return df.with_columns(
+            pl.when(s.str.len_chars() > self.max_cell_len).then(s.str.slice(0, self.max_cell_len) + "...").otherwise(s)
+        )
+
     def extension(self) -> str:
         return ".txt"
 
-    def write(self, lf: pl.LazyFrame) -> Iterable[bytes]:
+    def write(self, lf: Frame) -> Iterable[bytes]:
 
         table = Table(
             show_header=True,
@@ -33,15 +41,26 @@ class CliTableFormatter(TableWriter):
             row_styles=[_ALT_ROW_STYLE_0, _ALT_ROW_STYLE_1],
         )
 
-        for col in lf.collect_schema().names():
+        # The whole table is held in memory for rendering anyway, so collect once
+        # rather than resolving the schema and then collecting batches separately
+        df = collect_frame(lf)
+        columns = df.columns
+        for col in columns:
             table.add_column(col)
 
-        for batch in lf.collect_batches():
-            for row in batch.iter_rows():
-                table.add_row(*[self._truncate(str(v)) if v is not None else "" for v in row])
+        # String columns are truncated up front; only other dtypes need truncating after str()
+        truncate_in_python = [dtype != pl.String for dtype in df.dtypes]
+        if self.max_cell_len is not None:
+            df = self._truncate_strings(df)
+
+        for row in df.iter_rows():
+            table.add_row(*[
+                "" if v is None else self._truncate(str(v)) if truncate else v
+                for v, truncate in zip(row, truncate_in_python)
+            ])
 
         if self.truncated:
-            table.add_row(*["..." for _ in lf.collect_schema().names()])
+            table.add_row(*["..." for _ in columns])
 
         if self.svg_capture:
             console = Console(record=True, width=80)
@@ -38,6 +38,7 @@ class AwsBackend(CloudFsspecBackend):
         Args:
             anon: If True, use anonymous access (for public buckets only).
         """
+        super().__init__()
         try:
             import s3fs
         except ImportError as e:
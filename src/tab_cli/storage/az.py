@@ -15,6 +15,10 @@ class AzAuthMethod(Enum):
     AZURE_CLI = 5
 
 
+# Account keys don't expire, so each is fetched from the Azure CLI at most once per process
+_CLI_ACCOUNT_KEYS: dict[str, str] = {}
+
+
 class AzBackend(CloudFsspecBackend):
     """Storage backend for Azure Blob Storage with configurable URL interpretation.
 
@@ -35,6 +39,7 @@ class AzBackend(CloudFsspecBackend):
             az_url_authority_is_account: If True, interpret the URL authority as the
                 storage account name. If False, interpret it as the container name.
         """
+        super().__init__()
         try:
             import adlfs
         except ImportError as e:
@@ -131,6 +136,9 @@ class AzBackend(CloudFsspecBackend):
         """Try to get storage account key via Azure CLI."""
         import subprocess
 
+        if account in _CLI_ACCOUNT_KEYS:
+            return _CLI_ACCOUNT_KEYS[account]
+
         try:
             result = subprocess.run(
                 ["az", "storage", "account", "keys", "list",
@@ -142,7 +150,8 @@ class AzBackend(CloudFsspecBackend):
                 timeout=30,
             )
             if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
+                _CLI_ACCOUNT_KEYS[account] = result.stdout.strip()
+                return _CLI_ACCOUNT_KEYS[account]
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
         return None
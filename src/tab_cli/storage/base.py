@@ -1,9 +1,20 @@
 """Base storage backend interface."""
 
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import BinaryIO, Iterator, Any
 
+# Upper bound on concurrent metadata/IO requests against a storage backend
+MAX_IO_WORKERS = 32
+
+
+def is_data_file(path: str) -> bool:
+    """Check if a file is a data file (not metadata/marker file)."""
+    basename = os.path.basename(path.rstrip("/"))
+    # Skip hidden files (e.g., .crc files) or Spark/Hadoop marker and metadata files
+    return not basename.startswith((".", "_"))
+
 
 @dataclass
 class FileInfo:
@@ -14,7 +14,7 @@ from typing import BinaryIO, Iterator, Any
 import fsspec
 from loguru import logger
 
-from tab_cli.storage.base import FileInfo, StorageBackend
+from tab_cli.storage.base import FileInfo, StorageBackend, is_data_file
 from tab_cli.url_parser import parse_url
 
 
@@ -30,12 +30,20 @@ class FsspecBackend(StorageBackend):
 
     def __init__(self, protocol: str) -> None:
         self.protocol = protocol
+        self._init_caches()
 
         try:
             self.fs = fsspec.filesystem(protocol)
         except (ImportError, ValueError) as e:
             raise ImportError(f"No handler found for {protocol}:// URLs") from e
 
+    def _init_caches(self) -> None:
+        # Format inference, reading and summaries repeat the same listings and probes, so they
+        # are memoized for the lifetime of this backend (one CLI invocation)
+        self._find_cache: dict[str, dict[str, dict[str, Any]]] = {}
+        self._info_cache: dict[str, dict[str, Any]] = {}
+        self._is_directory_cache: dict[str, bool] = {}
+
     def _to_internal(self, url: str) -> str:
         """Convert URL to internal path for fsspec operations.
 
@@ -56,28 +64,49 @@ class FsspecBackend(StorageBackend):
     def open(self, url: str) -> BinaryIO:
         return self.fs.open(self._to_internal(url), "rb")
 
+    def _find(self, internal_path: str) -> dict[str, dict[str, Any]]:
+        entries = self._find_cache.get(internal_path)
+        if entries is None:
+            # A single recursive listing returns sizes along with paths, so no per-file stat is needed
+            entries = self._find_cache[internal_path] = self.fs.find(internal_path, detail=True)
+        return entries
+
     def list_files(self, url: str, extension: str) -> Iterator[FileInfo]:
-        internal_path = self._to_internal(url)
-        pattern = f"{internal_path}/**/*{extension}"
-        files = self.fs.glob(pattern)
-        logger.debug(f"{len(files)} files found.")
-        for path in sorted(files):
-            info = self.fs.info(path)
-            yield FileInfo(url=self._to_uri(path), size=info["size"])
+        entries = self._find(self._to_internal(url))
+        logger.debug(f"{len(entries)} entries listed.")
+        # The listing is already in memory; sort its keys and filter lazily rather than copying it
+        for path in sorted(entries):
+            info = entries[path]
+            if info.get("type") == "file" and path.endswith(extension) and is_data_file(path):
+                yield FileInfo(url=self._to_uri(path), size=info["size"])
+
+    def _info(self, internal_path: str) -> dict[str, Any]:
+        info = self._info_cache.get(internal_path)
+        if info is None:
+            # Shared by is_directory and size, so probing a file and then sizing it is one round trip
+            info = self._info_cache[internal_path] = self.fs.info(internal_path)
+        return info
 
     def size(self, url: str) -> int:
-        return self.fs.size(self._to_internal(url))
+        return self._info(self._to_internal(url))["size"]
 
     def is_directory(self, url: str) -> bool:
+        is_dir = self._is_directory_cache.get(url)
+        if is_dir is None:
+            is_dir = self._is_directory_cache[url] = self._probe_directory(url)
+        return is_dir
+
+    def _probe_directory(self, url: str) -> bool:
         path = self._to_internal(url)
         try:
-            info = self.fs.info(path)
+            info = self._info(path)
             return info.get("type") == "directory"
         except FileNotFoundError:
+            # Some object stores only report a prefix when it is listed; let any other error surface
             try:
                 contents = self.fs.ls(path, detail=False)
                 return len(contents) > 0
-            except Exception:
+            except FileNotFoundError:
                 return False
 
     def storage_options(self, url: str) -> dict[str, Any] | None:
@@ -91,8 +120,8 @@ class CloudFsspecBackend(FsspecBackend):
     """
 
     def __init__(self) -> None:
-        # Subclasses must set self.fs and self.protocol before calling methods
-        pass
+        # Subclasses must call this, then set self.fs and self.protocol before calling methods
+        self._init_caches()
 
     def _to_internal(self, url: str) -> str:
         """Convert URL to internal path (bucket/path) for cloud fsspec operations."""
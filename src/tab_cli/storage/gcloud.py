@@ -1,4 +1,6 @@
 import os
+import time
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
@@ -15,6 +17,17 @@ class GcloudAuthMethod(Enum):
     GOOGLE_DEFAULT = 4   # google.auth.default()
 
 
+# gcloud may hand back a cached token that is already close to expiry, so only reuse
+# it for a few minutes; that still spares one subprocess per URL within an invocation
+_CLI_TOKEN_TTL_SECONDS = 5 * 60
+
+
+@dataclass
+class _CachedToken:
+    value: str
+    expires_at: float
+
+
 class GcloudBackend(CloudFsspecBackend):
     """Storage backend for Google Cloud Storage.
 
@@ -28,9 +41,11 @@ class GcloudBackend(CloudFsspecBackend):
     """
 
     protocol = "gs"
+    _cli_token: _CachedToken | None = None
 
     def __init__(self) -> None:
         """Initialize the Google Cloud Storage backend."""
+        super().__init__()
         try:
             import gcsfs
         except ImportError as e:
@@ -115,6 +130,10 @@ class GcloudBackend(CloudFsspecBackend):
         """Get access token from gcloud CLI (gcloud auth print-access-token)."""
         import subprocess
 
+        cached = GcloudBackend._cli_token
+        if cached is not None and time.monotonic() < cached.expires_at:
+            return cached.value
+
         try:
             result = subprocess.run(
                 ["gcloud", "auth", "print-access-token"],
@@ -123,7 +142,9 @@ class GcloudBackend(CloudFsspecBackend):
                 timeout=30,
             )
             if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
+                token = result.stdout.strip()
+                GcloudBackend._cli_token = _CachedToken(token, time.monotonic() + _CLI_TOKEN_TTL_SECONDS)
+                return token
         except (subprocess.TimeoutExpired, FileNotFoundError):
             logger.debug("gcloud CLI not available or timed out")
         return None
@@ -160,7 +181,7 @@ class GcloudBackend(CloudFsspecBackend):
             }
         elif self.method == GcloudAuthMethod.GCLOUD_CLI:
             # For CLI token, we need to refresh it for Polars
-            # since the token may have expired
+            # since the token may have expired (refreshes are cached for a few minutes)
             fresh_token = self._get_access_token_via_cli()
             if fresh_token:
                 return {
@@ -1,10 +1,9 @@
 """Local filesystem storage backend."""
 
 import os
-from glob import glob
 from typing import BinaryIO, Iterator
 
-from tab_cli.storage.base import FileInfo, StorageBackend
+from tab_cli.storage.base import FileInfo, StorageBackend, is_data_file
 
 
 class LocalBackend(StorageBackend):
@@ -14,9 +13,29 @@ class LocalBackend(StorageBackend):
         return open(url, "rb")
 
     def list_files(self, url: str, extension: str) -> Iterator[FileInfo]:
-        pattern = os.path.join(url, "**", f"*{extension}")
-        for path in sorted(glob(pattern, recursive=True)):
-            yield FileInfo(url=path, size=os.path.getsize(path))
+        # Walk lazily, one sorted directory level at a time, so callers that only
+        # need the first file (e.g. format inference) don't enumerate the whole tree.
+        # Files come out in full-path order, as sorted(glob(...)) and FsspecBackend give them.
+        # An explicit stack avoids re-yielding each file through every nesting level.
+        stack = [self._sorted_entries(url)]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+            elif entry.is_dir():  # Answered from the directory listing, no stat needed
+                stack.append(self._sorted_entries(entry.path))
+            elif entry.name.endswith(extension) and is_data_file(entry.name):
+                yield FileInfo(url=entry.path, size=entry.stat().st_size)
+
+    def _sorted_entries(self, path: str) -> Iterator[os.DirEntry]:
+        with os.scandir(path) as it:
+            # Hidden entries are skipped, as glob("**") would
+            return iter(sorted((e for e in it if not e.name.startswith(".")), key=self._path_order))
+
+    @staticmethod
+    def _path_order(entry: os.DirEntry) -> str:
+        # A directory's files sort as "name/...", so "a.csv" precedes "a/b.csv" as in a full-path sort
+        return entry.name + "/" if entry.is_dir() else entry.name
 
     def size(self, url: str) -> int:
         return os.path.getsize(url)
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 from urllib.parse import urlparse
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedUrl:
     """Parsed URL components for cloud storage."""
 
@@ -40,6 +41,15 @@ def parse_url(url: str) -> ParsedUrl:
     Returns:
         ParsedUrl with scheme, bucket, account, and path components.
     """
+    from tab_cli import config
+
+    # Backends re-parse the same URLs for every operation, so results are memoized.
+    # The flag and environment variable that affect Azure parsing are part of the key.
+    return _parse_url(url, config.config.az_url_authority_is_account, os.environ.get("AZURE_STORAGE_ACCOUNT"))
+
+
+@lru_cache(maxsize=1024)
+def _parse_url(url: str, az_url_authority_is_account: bool, default_account: str | None) -> ParsedUrl:
     # Strips trailing slashes to avoid empty path segments
     url = url.rstrip("/")
     parsed = urlparse(url)
@@ -63,18 +73,16 @@ def parse_url(url: str) -> ParsedUrl:
 
     # Azure Blob: az://container/path or az://account/container/path
     if scheme == "az":
-        from tab_cli import config
-
-        if config.config.az_url_authority_is_account:
+        if az_url_authority_is_account:
             # az://account/container/path or az:///container/path
-            account = parsed.netloc if parsed.netloc else os.environ.get("AZURE_STORAGE_ACCOUNT")
+            account = parsed.netloc if parsed.netloc else default_account
             # Path is /container/path, first segment is container
             path_parts = parsed.path.lstrip("/").split("/", 1)
             container = path_parts[0] if path_parts else None
             path = path_parts[1] if len(path_parts) > 1 else ""
         else:
             # az://container/path (default adlfs behavior)
-            account = os.environ.get("AZURE_STORAGE_ACCOUNT")
+            account = default_account
             container = parsed.netloc
             path = parsed.path.lstrip("/")
         return ParsedUrl(scheme=scheme, bucket=container, account=account, path=path, original=url)
@@ -91,7 +99,7 @@ def parse_url(url: str) -> ParsedUrl:
         else:
             # container only, account from env
             container = netloc
-            account = os.environ.get("AZURE_STORAGE_ACCOUNT")
+            account = default_account
         path = parsed.path.lstrip("/")
         return ParsedUrl(scheme=scheme, bucket=container, account=account, path=path, original=url)
 
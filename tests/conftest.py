@@ -0,0 +1,30 @@
+from functools import partial
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def app():
+    from tab_cli.cli import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def runner():
+    # A fixed, colourless terminal keeps Rich from probing the real one and keeps table layout stable
+    return CliRunner(env={"COLUMNS": "120", "LINES": "40", "TERM": "dumb", "NO_COLOR": "1"})
+
+
+@pytest.fixture(scope="session")
+def invoke(runner, app):
+    """Invoke the tab CLI with the given argv."""
+    return partial(runner.invoke, app)
+
+
+@pytest.fixture(scope="session")
+def test_csv_bytes():
+    """Contents of assets/test.csv, read once for tests that copy it into place."""
+    return (Path(__file__).parent / "assets" / "test.csv").read_bytes()
@@ -1,108 +1,334 @@
 """Tests for the tab CLI commands."""
 
+import json
 import os
+import re
+import subprocess
+import sys
+from functools import cache
+from pathlib import Path
 
-from typer.testing import CliRunner
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
 
-from tab_cli.cli import app
+# Resolved once at import; fails fast at collection if the asset is missing
+TEST_CSV = str((Path(__file__).parent / "assets" / "test.csv").resolve(strict=True))
+# The row of ellipses the table view prints when rows were cut off; its padding follows the column widths
+TRUNCATION_ROW = re.compile(r"^\s*\.\.\.(?:\s+\.\.\.)+\s*$", re.MULTILINE)
 
-runner = CliRunner()
-TEST_CSV = os.path.join(os.path.dirname(__file__), "assets", "test.csv")
 
+# (argv, expected exit code, substrings that must appear, substrings that must not appear)
+CASES = [
+    pytest.param(["view", TEST_CSV], 0, ["P001", "Control"], [], id="view-basic"),
+    # Row 3 (P002 second row) should not appear; no truncation indicator when explicit limit
+    pytest.param(["view", TEST_CSV, "--limit", "2"], 0, ["P001"], ["P003", "..."], id="view-limit"),
+    # First 6 rows skipped; only P004 rows remain
+    pytest.param(["view", TEST_CSV, "--skip", "6", "--limit", "10"], 0, ["P004"], ["P001"], id="view-skip"),
+    # "Control" (7 chars) is truncated to "Contr..."; "P001" (4 chars) fits within 5
+    pytest.param(["view", TEST_CSV, "--max-cell-len", "5"], 0, ["Contr...", "P001"], [], id="view-max-cell-len"),
+    # view has no -o option
+    pytest.param(["view", TEST_CSV, "-o", "csv"], 2, [], [], id="view-no-output-flag"),
+    # cat writes the input format (CSV), not a Rich table with box-drawing chars
+    pytest.param(["cat", TEST_CSV], 0, ["P001"], ["─"], id="cat-basic"),
+    # Shown as a table by default (no -o)
+    pytest.param(["sql", "SELECT * FROM t WHERE Status = 'Baseline'", TEST_CSV], 0, ["Baseline"], ["Active"], id="sql-table-output"),
+]
 
-class TestView:
-    def test_basic(self):
-        result = runner.invoke(app, ["view", TEST_CSV])
-        assert result.exit_code == 0
-        assert "P001" in result.output
-        assert "Control" in result.output
 
-    def test_limit(self):
-        result = runner.invoke(app, ["view", TEST_CSV, "--limit", "2"])
-        assert result.exit_code == 0
-        assert "P001" in result.output
-        # Row 3 (P002 second row) should not appear
-        assert "P003" not in result.output
-        # No truncation indicator when explicit limit
-        assert "..." not in result.output
+def head_and_count(output: str) -> tuple[str, int]:
+    """Return the first line of the output and its number of lines."""
+    output = output.strip()
+    if not output:
+        return "", 0
+    newline = output.find("\n")
+    return (output if newline < 0 else output[:newline]), output.count("\n") + 1
 
-    def test_skip(self):
-        result = runner.invoke(app, ["view", TEST_CSV, "--skip", "6", "--limit", "10"])
-        assert result.exit_code == 0
-        # First 6 rows skipped; only P004 rows remain
-        assert "P001" not in result.output
-        assert "P004" in result.output
 
-    def test_max_cell_len(self):
-        result = runner.invoke(app, ["view", TEST_CSV, "--max-cell-len", "5"])
-        assert result.exit_code == 0
-        # "Control" (7 chars) should be truncated to "Contr..."
-        assert "Contr..." in result.output
-        # "P001" (4 chars) fits within 5, should appear as-is
-        assert "P001" in result.output
+@cache
+def _alternation(texts: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, texts)))
+
 
-    def test_no_output_flag(self):
-        result = runner.invoke(app, ["view", TEST_CSV, "-o", "csv"])
-        assert result.exit_code != 0
+@pytest.mark.parametrize("argv, expected_exit, must_contain, must_not_contain", CASES)
+def test_output(invoke, argv, expected_exit, must_contain, must_not_contain):
+    # Usage errors still arrive as exit codes; anything else propagates with its own traceback
+    result = invoke(argv, catch_exceptions=False)
+    assert result.exit_code == expected_exit
+    # One pass over the output per list, rather than one per substring
+    if must_contain:
+        assert set(_alternation(tuple(must_contain)).findall(result.output)) == set(must_contain)
+    if must_not_contain:
+        match = _alternation(tuple(must_not_contain)).search(result.output)
+        assert match is None, f"unexpected {match.group()!r} in output"
 
-    def test_truncation_indicator(self):
+
+class TestView:
+    def test_truncation_indicator(self, invoke):
         """With no --limit and more than 20 rows, truncation '...' should appear.
         Our test.csv only has 8 rows, so no truncation."""
-        result = runner.invoke(app, ["view", TEST_CSV])
+        result = invoke(["view", TEST_CSV])
         assert result.exit_code == 0
         # 8 rows < 20 default limit, so no truncation
-        lines_with_ellipsis = [l for l in result.output.splitlines() if l.strip() == "...   ...   ...   ...   ...   ..."]
-        assert len(lines_with_ellipsis) == 0
+        assert TRUNCATION_ROW.search(result.output) is None
+
+    @pytest.mark.parametrize("name", ["x.b#c.csv", "x?.csv"])
+    def test_local_name_with_url_characters(self, invoke, tmp_path, test_csv_bytes, name):
+        # "?" and "#" only start a query or fragment in URLs, not in local file names
+        (tmp_path / name).write_bytes(test_csv_bytes)
+        result = invoke(["view", str(tmp_path / name)])
+        assert result.exit_code == 0
+        assert "P001" in result.output
 
 
 class TestCat:
-    def test_basic_outputs_csv(self):
-        result = runner.invoke(app, ["cat", TEST_CSV])
+    def test_output_format_csv(self, capfd):
+        from tab_cli.cli import cat
+
+        # Only the output shape matters here, so call the command directly instead of parsing argv
+        cat([TEST_CSV], output="csv")
+        header, num_lines = head_and_count(capfd.readouterr().out)
+        # CSV header
+        assert "Participant_ID" in header
+        # Should have header + 8 data rows
+        assert num_lines == 9
+
+    def test_output_format_tsv(self, invoke):
+        result = invoke(["cat", TEST_CSV, "-o", "tsv"])
         assert result.exit_code == 0
-        # Should output in CSV format (the input format), not a Rich table
-        assert "Participant_ID," in result.output or "Participant_ID\t" in result.output or "P001" in result.output
+        header, _ = head_and_count(result.output)
+        assert "\t" in header
 
-    def test_output_format_csv(self):
-        result = runner.invoke(app, ["cat", TEST_CSV, "-o", "csv"])
+    def test_multiple_files(self, invoke):
+        result = invoke(["cat", TEST_CSV, TEST_CSV, "-o", "csv"])
         assert result.exit_code == 0
         lines = result.output.strip().splitlines()
-        # CSV header
-        assert "Participant_ID" in lines[0]
-        # Should have header + 8 data rows
-        assert len(lines) == 9
+        # One header + 8 data rows from each file
+        assert len(lines) == 17
+        assert lines.count(lines[0]) == 1
 
-    def test_output_format_tsv(self):
-        result = runner.invoke(app, ["cat", TEST_CSV, "-o", "tsv"])
+    def test_output_format_jsonl(self, invoke):
+        result = invoke(["cat", TEST_CSV, "-o", "jsonl"])
         assert result.exit_code == 0
         lines = result.output.strip().splitlines()
-        assert "\t" in lines[0]
+        assert len(lines) == 8
+        assert json.loads(lines[0])["Participant_ID"] == "P001"
+
+    @pytest.mark.parametrize("output", ["csv", "jsonl", "parquet"])
+    def test_broken_pipe_exits_quietly(self, tmp_path, output):
+        # Far more output than the pipe and stdout buffers hold, even as compressed Parquet,
+        # so writes hit the closed pipe
+        big = tmp_path / "big.csv"
+        big.write_text("id,value\n" + "".join(f"{i},{i * 2654435761 % 2**32}\n" for i in range(1_000_000)))
+        # CliRunner captures into memory, so a real pipe needs a real process (`tab cat ... | head`)
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "tab_cli.cli", "cat", str(big), "-o", output],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        proc.stdout.read(16)
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+        proc.stderr.close()
+        assert proc.wait() == 1
+        assert b"Traceback" not in stderr
+        assert b"Broken pipe" not in stderr
 
-    def test_no_rich_table(self):
-        """cat without -o should NOT produce a Rich formatted table."""
-        result = runner.invoke(app, ["cat", TEST_CSV])
+    def test_output_format_parquet(self, invoke):
+        result = invoke(["cat", TEST_CSV, "-o", "parquet"])
         assert result.exit_code == 0
-        # Rich tables use box-drawing chars; CSV output won't
-        assert "─" not in result.output
+        # Parquet files start and end with the magic bytes
+        assert result.stdout_bytes.startswith(b"PAR1")
+        assert result.stdout_bytes.endswith(b"PAR1")
 
 
 class TestSql:
-    def test_basic_table_output(self):
-        result = runner.invoke(app, ["sql", "SELECT * FROM t WHERE Status = 'Baseline'", TEST_CSV])
-        assert result.exit_code == 0
-        assert "Baseline" in result.output
-        # Should show as a table by default (no -o)
-        assert "Active" not in result.output
+    def test_with_output_format(self, capfd):
+        from tab_cli.cli import sql
 
-    def test_with_output_format(self):
-        result = runner.invoke(app, ["sql", "SELECT Participant_ID, Status FROM t", TEST_CSV, "-o", "csv"])
-        assert result.exit_code == 0
-        lines = result.output.strip().splitlines()
-        assert "Participant_ID" in lines[0]
-        assert "Status" in lines[0]
+        sql("SELECT Participant_ID, Status FROM t", TEST_CSV, output="csv")
+        header, _ = head_and_count(capfd.readouterr().out)
+        assert "Participant_ID" in header
+        assert "Status" in header
 
-    def test_limit(self):
-        result = runner.invoke(app, ["sql", "SELECT * FROM t", TEST_CSV, "--limit", "2"])
+    def test_limit(self, invoke):
+        result = invoke(["sql", "SELECT * FROM t", TEST_CSV, "--limit", "2"])
         assert result.exit_code == 0
         # Should have limited rows
         count = sum(1 for line in result.output.splitlines() if "P00" in line)
         assert count <= 2
+
+    def test_default_limit_truncates(self, invoke):
+        # 3 x 8 = 24 rows exceeds the default limit of 20
+        query = "SELECT * FROM t UNION ALL SELECT * FROM t UNION ALL SELECT * FROM t"
+        result = invoke(["sql", query, TEST_CSV])
+        assert result.exit_code == 0
+        count = sum(1 for line in result.output.splitlines() if "P00" in line)
+        assert count == 20
+        assert TRUNCATION_ROW.search(result.output) is not None
+
+
+class TestSummary:
+    def test_csv(self, invoke):
+        result = invoke(["summary", TEST_CSV])
+        assert result.exit_code == 0
+        rows_line = next(line for line in result.output.splitlines() if "Rows" in line)
+        assert "8" in rows_line
+        columns_line = next(line for line in result.output.splitlines() if "Columns" in line)
+        assert "6" in columns_line
+
+
+@pytest.fixture(scope="module")
+def parquet_path(invoke, tmp_path_factory) -> str:
+    # Converted once and shared read-only by the tests that need a Parquet input
+    dst = str(tmp_path_factory.mktemp("parquet") / "test.parquet")
+    result = invoke(["convert", TEST_CSV, dst, "-o", "parquet"])
+    assert result.exit_code == 0
+    return dst
+
+
+class TestParquet:
+    def test_schema(self, invoke, parquet_path):
+        result = invoke(["schema", parquet_path])
+        assert result.exit_code == 0
+        assert "Participant_ID" in result.output
+        assert "Float64" in result.output
+
+    def test_summary(self, invoke, parquet_path):
+        result = invoke(["summary", parquet_path])
+        assert result.exit_code == 0
+        rows_line = next(line for line in result.output.splitlines() if "Rows" in line)
+        assert "8" in rows_line
+        assert "Row groups" in result.output
+        assert "Compression" in result.output
+
+
+class TestConvert:
+    def test_partitions(self, invoke, tmp_path):
+        dst = tmp_path / "out"
+        result = invoke(["convert", TEST_CSV, str(dst), "-o", "csv", "-n", "3"])
+        assert result.exit_code == 0
+        parts = sorted(os.listdir(dst))
+        assert len(parts) == 3
+        rows = sum(len((dst / part).read_text().strip().splitlines()) - 1 for part in parts)
+        assert rows == 8
+
+
+class TestDirectory:
+    def _make_dir(self, tmp_path, contents: bytes):
+        for part in ["part-0", "part-1"]:
+            (tmp_path / part).mkdir()
+            (tmp_path / part / "data.csv").write_bytes(contents)
+        # Marker files should not affect format inference
+        (tmp_path / "_SUCCESS").touch()
+        return str(tmp_path)
+
+    def test_cat(self, invoke, tmp_path, test_csv_bytes):
+        result = invoke(["cat", self._make_dir(tmp_path, test_csv_bytes)])
+        assert result.exit_code == 0
+        assert len(result.output.strip().splitlines()) == 17
+
+    def test_cat_full_path_order(self, invoke, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "b.csv").write_text("x\n2\n")
+        (tmp_path / "a.csv").write_text("x\n1\n")
+        (tmp_path / "a-b.csv").write_text("x\n0\n")
+        result = invoke(["cat", str(tmp_path)])
+        assert result.exit_code == 0
+        # Sorted by full path: a-b.csv, a.csv, a/b.csv
+        assert result.output.split() == ["x", "0", "1", "2"]
+
+    def test_cat_matches_summary(self, invoke, tmp_path, test_csv_bytes):
+        (tmp_path / "a.csv").write_bytes(test_csv_bytes)
+        # Underscore-prefixed files are metadata, and are skipped by every command alike
+        (tmp_path / "_b.csv").write_bytes(test_csv_bytes)
+        result = invoke(["cat", str(tmp_path)])
+        assert result.exit_code == 0
+        _, num_lines = head_and_count(result.output)
+        result = invoke(["summary", str(tmp_path)])
+        assert result.exit_code == 0
+        rows_line = next(line for line in result.output.splitlines() if "Rows" in line)
+        assert rows_line.split()[-1] == str(num_lines - 1) == "8"
+
+    def _make_hive_dir(self, invoke, tmp_path):
+        for key in ["1", "2"]:
+            (tmp_path / f"k={key}").mkdir()
+            result = invoke(["convert", TEST_CSV, str(tmp_path / f"k={key}" / "data.parquet"), "-o", "parquet"])
+            assert result.exit_code == 0
+        return str(tmp_path)
+
+    def test_cat_hive_partitions(self, invoke, tmp_path):
+        result = invoke(["cat", self._make_hive_dir(invoke, tmp_path), "-o", "jsonl"])
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.output.strip().splitlines()]
+        assert len(rows) == 16
+        assert {row["k"] for row in rows} == {1, 2}
+
+    def test_schema_hive_partitions(self, invoke, tmp_path):
+        path = self._make_hive_dir(invoke, tmp_path)
+        result = invoke(["schema", path])
+        assert result.exit_code == 0
+        # The 6 file columns plus the partition column, as cat/view/sql return them
+        assert ["k", "Int64"] in [line.split() for line in result.output.splitlines()]
+        result = invoke(["summary", path])
+        assert result.exit_code == 0
+        columns_line = next(line for line in result.output.splitlines() if "Columns" in line)
+        assert columns_line.split()[-1] == "7"
+
+    def _write_parquet(self, invoke, path, csv_text: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        source = path.with_suffix(".csv.tmp")
+        source.write_text(csv_text)
+        result = invoke(["convert", str(source), str(path), "-i", "csv", "-o", "parquet"])
+        assert result.exit_code == 0
+        source.unlink()
+
+    def test_cat_ignores_partitions_above_root(self, invoke, tmp_path):
+        self._write_parquet(invoke, tmp_path / "proj=x" / "data" / "p.parquet", "a,b\n1,2\n")
+        result = invoke(["cat", str(tmp_path / "proj=x" / "data"), "-o", "csv"])
+        assert result.exit_code == 0
+        assert result.output.strip().splitlines() == ["a,b", "1,2"]
+
+    def test_cat_file_column_wins_over_partition(self, invoke, tmp_path):
+        self._write_parquet(invoke, tmp_path / "col" / "a=9" / "p.parquet", "a\n1\n2\n")
+        result = invoke(["cat", str(tmp_path / "col"), "-o", "csv"])
+        assert result.exit_code == 0
+        assert result.output.strip().splitlines() == ["a", "1", "2"]
+
+    def test_mixed_partition_depths(self, invoke, tmp_path):
+        self._write_parquet(invoke, tmp_path / "p1.parquet", "a\n1\n2\n")
+        self._write_parquet(invoke, tmp_path / "k=1" / "p2.parquet", "a\n3\n")
+        result = invoke(["cat", str(tmp_path), "-o", "jsonl"])
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.output.strip().splitlines()]
+        assert sorted(rows, key=lambda row: row["a"]) == [{"a": 1, "k": None}, {"a": 2, "k": None}, {"a": 3, "k": 1}]
+        result = invoke(["schema", str(tmp_path)])
+        assert result.exit_code == 0
+        assert ["k", "Int64"] in [line.split() for line in result.output.splitlines()]
+        result = invoke(["summary", str(tmp_path)])
+        assert result.exit_code == 0
+        columns_line = next(line for line in result.output.splitlines() if "Columns" in line)
+        assert columns_line.split()[-1] == "2"
+
+    def test_summary_merges_compression(self, invoke, tmp_path):
+        table = pa.table({"a": [1], "b": ["x"]})
+        pq.write_table(table, tmp_path / "p1.parquet", compression="snappy")
+        pq.write_table(table, tmp_path / "p2.parquet", compression={"a": "snappy", "b": "zstd"})
+        result = invoke(["summary", str(tmp_path)])
+        assert result.exit_code == 0
+        compression_line = next(line for line in result.output.splitlines() if "Compression" in line)
+        assert compression_line.split(maxsplit=1)[-1].strip() == "SNAPPY, ZSTD"
+
+    def test_summary(self, invoke, tmp_path, test_csv_bytes):
+        result = invoke(["summary", self._make_dir(tmp_path, test_csv_bytes)])
+        assert result.exit_code == 0
+        partitions_line = next(line for line in result.output.splitlines() if "Partitions" in line)
+        assert "2" in partitions_line
+
+    def test_cat_avro(self, invoke, tmp_path):
+        for part in ["part-0.avro", "part-1.avro"]:
+            result = invoke(["convert", TEST_CSV, str(tmp_path / part), "-o", "avro"])
+            assert result.exit_code == 0
+        result = invoke(["cat", str(tmp_path), "-o", "csv"])
+        assert result.exit_code == 0
+        assert len(result.output.strip().splitlines()) == 17
@@ -0,0 +1,48 @@
+"""Tests for the format handlers."""
+
+import json
+from io import BytesIO
+
+import polars as pl
+import pytest
+
+from tab_cli.formats.jsonl import JsonlFormat
+from tab_cli.formats.parquet import ParquetFormat
+
+
+class TestParquetWrite:
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_round_trip(self, lazy):
+        # Enough rows for several batches, so the output spans several row groups
+        df = pl.DataFrame({"a": range(250_000)}).with_columns(b=pl.col("a").cast(pl.String))
+        frame = df.lazy() if lazy else df
+        chunks = list(ParquetFormat().write(frame))
+        assert len(chunks) > 1
+        assert pl.read_parquet(BytesIO(b"".join(chunks))).equals(df)
+
+    def test_empty_frame_keeps_schema(self):
+        # No batches come out, so the writer is created from the frame's schema alone
+        frame = pl.LazyFrame(schema={"a": pl.Int64, "b": pl.String})
+        result = pl.read_parquet(BytesIO(b"".join(ParquetFormat().write(frame))))
+        assert result.is_empty()
+        assert result.schema == pl.Schema({"a": pl.Int64, "b": pl.String})
+
+
+class TestJsonlWrite:
+    # Binary nested in a struct or list must be encoded too, or the native encoder panics
+    frame = pl.DataFrame({"b": [b"\x00", None], "s": [{"b": b"\x00"}, None], "l": [[b"\x01"], []]})
+    expected = ({"b": "AA==", "s": {"b": "AA=="}, "l": ["AQ=="]}, {"b": None, "s": None, "l": []})
+
+    def test_write(self):
+        lines = b"".join(JsonlFormat().write(self.frame.lazy())).splitlines()
+        assert [json.loads(line) for line in lines] == list(self.expected)
+
+    def test_write_to_stream(self):
+        stream = BytesIO()
+        JsonlFormat().write_to_stream(self.frame, stream)
+        assert [json.loads(line) for line in stream.getvalue().splitlines()] == list(self.expected)
+
+    def test_write_to_single_file(self, tmp_path):
+        path = tmp_path / "out.jsonl"
+        JsonlFormat().write_to_single_file(self.frame.lazy(), str(path))
+        assert [json.loads(line) for line in path.read_text().splitlines()] == list(self.expected)